@@ -72,10 +72,13 @@ Altenratively, you can mark two opposize corners on the board, and reset zero on
 """
 
 import adsk.core, adsk.fusion, adsk.cam, traceback
-import math
+import functools, math
+
+# Geometry doesn't depend on Fusion and lives in a separate file, next to this script
+from .SpoilboardGeometry import Hole, NoSpoilboardHolesError, deriveMillingParameters, prepareHoles, requiredCountersinkDepth
 
 maxExceptions = 4 # script will not show more exceptions than this
-exceptionUICounter = 0 
+holeFailures = [] # (where, traceback) for hole features that failed, reported together at the end of the run
 cleanModel = True       # script will remove objects and stetches from the project - simplifies script debug
 
 # 1. General Rendering configuration
@@ -164,37 +167,37 @@ boardXsymmetrical = True
 boardYsymmetrical = True
 
 # Now go through the holes on not symmetrical and set up
-# [X,Y,mount] hole _centers_ measured from the edge of cnc bed
+# Hole(X,Y,mount) hole _centers_ measured from the edge of cnc bed
 # try to be within 1mm precision
 # third parameter is true or false. true if it will be used to secure Spoilboard on the bed
 holes = [
     #row 1
-        [20, 20, True], # "true" marks holes used to mount Spoilboard to the bed, they will get chamfer 
-        [80, 20, False],
-        [140, 20, False],
+        Hole(20, 20, True), # "true" marks holes used to mount Spoilboard to the bed, they will get chamfer 
+        Hole(80, 20, False),
+        Hole(140, 20, False),
 
     #row 2
-        [50, 45, False],
-        [110, 45, False],
+        Hole(50, 45, False),
+        Hole(110, 45, False),
 
     #row 3
-        [20, 70, False],
-        [80, 70, False],
-        [140, 70, False],
+        Hole(20, 70, False),
+        Hole(80, 70, False),
+        Hole(140, 70, False),
 
     #row 4
-        [110, 97.5, False],
+        Hole(110, 97.5, False),
 
     #row 5
-        [70, 108, False],
+        Hole(70, 108, False),
 
     #row 6
-        [20, 125, False],
-        [140, 125, False],
+        Hole(20, 125, False),
+        Hole(140, 125, False),
 
     #row 7
-        [70, bedYdimension/2, False],
-        [110, bedYdimension/2, False],
+        Hole(70, bedYdimension/2, False),
+        Hole(110, bedYdimension/2, False),
 ]
 # 4. Positioning and clearances (likely don't need to change)
 
@@ -235,75 +238,75 @@ rootComp = app.activeProduct.rootComponent
 def toCM(value):
     return value/10.0;
 
+# ValueInputs are immutable, so the few distinct sizes and angles are cached
+@functools.lru_cache(maxsize=64)
 def createMMValue(value):
-    # TODO: confirm this
-    return adsk.core.ValueInput.createByReal(toCM(value))
+    # Fusion API works in cm
+    return adsk.core.ValueInput.createByReal(value/10.0)
 
+@functools.lru_cache(maxsize=64)
 def createDegValue(degrees):
-    # Create a ValueInput for a value in degrees
-    return adsk.core.ValueInput.createByString(f"{degrees} deg")
-
+    # Fusion API works in radians
+    return adsk.core.ValueInput.createByReal(math.radians(degrees))
 
 def deleteAllBodiesAndSketches():
-    # Delete all bodies
-    while rootComp.bRepBodies.count > 0:
-        body = rootComp.bRepBodies.item(0)
+    # Delete all bodies, newest first
+    for body in reversed(list(rootComp.bRepBodies)):
         body.deleteMe()
 
-    # Delete all sketches
-    while rootComp.sketches.count > 0:
-        sketch = rootComp.sketches.item(0)
+    # Delete all sketches, newest first
+    for sketch in reversed(list(rootComp.sketches)):
         sketch.deleteMe()
 
 
 def renderBox(name, sizeX, sizeY, sizeZ, cornerX, cornerY, cornerZ):
-    # Create a new sketch on the xy plane for the box
-    sketches = rootComp.sketches
-    xyPlane = rootComp.xYConstructionPlane
-    boxSketch = sketches.add(xyPlane)
-
-    # Draw a rectangle on the sketch for the box
-    lines = boxSketch.sketchCurves.sketchLines
-    rect = lines.addTwoPointRectangle(adsk.core.Point3D.create(toCM(cornerX), toCM(cornerY), toCM(cornerZ)),
-                                      adsk.core.Point3D.create(toCM(cornerX + sizeX), toCM(cornerY + sizeY), toCM(cornerZ)))
-
-    # Extrude the sketch to create the box
-    prof = boxSketch.profiles.item(0)
-    extrudes = rootComp.features.extrudeFeatures
-    extInput = extrudes.createInput(prof, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-
-    # Define the distance for the extrusion
-    distance = createMMValue(sizeZ)
-    extInput.setDistanceExtent(False, distance)
-
-    # Create the box
-    box = extrudes.add(extInput)
-
-    # Delete the sketch
-    boxSketch.deleteMe()
+    # Create the box as a temporary BRep body
+    center = adsk.core.Point3D.create(toCM(cornerX + sizeX/2), toCM(cornerY + sizeY/2), toCM(cornerZ + sizeZ/2))
+    boxBounds = adsk.core.OrientedBoundingBox3D.create(center, adsk.core.Vector3D.create(1, 0, 0), adsk.core.Vector3D.create(0, 1, 0),
+                                                      toCM(sizeX), toCM(sizeY), toCM(sizeZ))
+    box = adsk.fusion.TemporaryBRepManager.get().createBox(boxBounds)
+
+    design = adsk.fusion.Design.cast(app.activeProduct)
+    if design.designType == adsk.fusion.DesignTypes.DirectDesignType:
+        body = rootComp.bRepBodies.add(box)
+    else:
+        # parametric designs only accept BRep bodies inside a base feature
+        baseFeature = rootComp.features.baseFeatures.add()
+        baseFeature.startEdit()
+        rootComp.bRepBodies.add(box, baseFeature)
+        baseFeature.finishEdit()
+        if baseFeature.bodies.count == 0:
+            raise Exception('No body was created by the base feature.')
+        body = baseFeature.bodies.item(0)
 
     # Set name
-    if box.bodies.count == 0:
-        raise Exception('No body was created by the extrusion.')
-    body = box.bodies.item(0)
     body.name = name
     return body
 
-def createSketchWithPoints(name, component, points, plane, mountingHoles, shiftX, shiftY):
-    # Create a new sketch on the specified plane
-    sketches = component.sketches
-    sketch = sketches.add(plane)
-    sketch.name = name
-    # Iterate over the points array and add them to the sketch
-    for point in points:
-        x, y, mounting = point  # Extract x and y coordinates
-        if mounting == mountingHoles:
-            sketchPoint = adsk.core.Point3D.create(toCM(x + shiftX), toCM(y + shiftY), 0)  # Create a Fusion 360 point
-            sketch.sketchPoints.add(sketchPoint)  # Add the point to the sketch
-    
-    sketch.sketchPoints.item(0).deleteMe()
-    return sketch
+def createSketchWithPoints(name, component, points, plane, shiftX, shiftY):
+    # Adds all points to a new sketch, returns (sketch, sketch points in the order of points)
+    if not points: # don't create an empty sketch
+        return (None, [])
+
+    createPoint = adsk.core.Point3D.create
+    sketchPoints = [createPoint((x + shiftX)/10.0, (y + shiftY)/10.0, 0) for x, y, mounting in points]
 
+    sketch = component.sketches.add(plane)
+    sketch.name = name
+    sketch.isComputeDeferred = True # recompute once, after all points are added
+    try:
+        addPoint = sketch.sketchPoints.add
+        addedPoints = [addPoint(sketchPoint) for sketchPoint in sketchPoints]
+    finally:
+        sketch.isComputeDeferred = False
+    return (sketch, addedPoints)
+
+def createSplitSketchWithPoints(name, component, points, plane, shiftX, shiftY):
+    # One sketch for all points, split into (sketch, mounting points, drilling points)
+    (sketch, addedPoints) = createSketchWithPoints(name, component, points, plane, shiftX, shiftY)
+    mountingPoints = [sketchPoint for (hole, sketchPoint) in zip(points, addedPoints) if hole.mounting]
+    drillingPoints = [sketchPoint for (hole, sketchPoint) in zip(points, addedPoints) if not hole.mounting]
+    return (sketch, mountingPoints, drillingPoints)
 
 def getSketchPointCoordinates(sketchPoint):
     pointGeometry = sketchPoint.geometry
@@ -311,210 +314,133 @@ def getSketchPointCoordinates(sketchPoint):
     y = pointGeometry.y
     return f"({x}, {y})"
 
-def createHolesFromSketch(targetBody, points, diameter, depth, countersinkDiameter=0, countersinkAngle=0, millTipAngle=0):
-    # Iterate through all sketch points and create holes
-    holes = rootComp.features.holeFeatures
+def holeInputFactory(diameter, countersinkDiameter=0, countersinkAngle=0, counterboreDepth=0):
+    # Returns a callable that creates the hole input, counterboreDepth is only used for flat (0 degree) countersinks
+    diameterValue = createMMValue(diameter)
+    if countersinkDiameter <= diameter:
+        return lambda holes: holes.createSimpleInput(diameterValue)
 
-    #skipFirst = True 
-    #points.sketchPoints.item(0).deleteMe()
-    collection = adsk.core.ObjectCollection.create()
-    skipFirst = True # hack to avoud first point on the sketch - zero,zero
-    hasPoints = False
-    for sketchPoint in points.sketchPoints:
-        if skipFirst:
-            skipFirst = False
-            continue
-        collection.add(sketchPoint)
-        hasPoints = True
-        
-    if not hasPoints:   # no actual points were added, return
+    countersinkDiameterValue = createMMValue(countersinkDiameter)
+    if countersinkAngle:
+        countersinkAngleValue = createDegValue(countersinkAngle)
+        return lambda holes: holes.createCountersinkInput(diameterValue, countersinkDiameterValue, countersinkAngleValue)
+
+    counterboreDepthValue = createMMValue(counterboreDepth)
+    return lambda holes: holes.createCounterboreInput(diameterValue, countersinkDiameterValue, counterboreDepthValue)
+
+def createHolesFromSketch(targetBody, points, createHoleInput, depth, millTipAngle=0):
+    # Create one hole feature for all sketch points, createHoleInput comes from holeInputFactory
+    if not points:   # no actual points were added, return
         return
-    
+
+    holes = rootComp.features.holeFeatures
+    depthValue = createMMValue(depth)
+    tipAngleValue = createDegValue(millTipAngle) if millTipAngle else None
+
     try:
-        if countersinkAngle and countersinkDiameter > diameter:
-            holeInput = holes.createCountersinkInput(createMMValue(diameter), createMMValue(countersinkDiameter), createDegValue(countersinkAngle))
-        elif countersinkDiameter > diameter: # TODO: support counterbore depth
-            holeInput = holes.createCounterboreInput(createMMValue(diameter), createMMValue(countersinkDiameter), createMMValue(screwCountersunkDepth))
-        else:
-            holeInput = holes.createSimpleInput(createMMValue(diameter))
+        holeInput = createHoleInput(holes)
 
         holeInput.participantBodies = [targetBody]
 
-        holeInput.setPositionBySketchPoints(collection)
-        holeInput.setDistanceExtent(createMMValue(depth))
+        holeInput.setPositionBySketchPoints(adsk.core.ObjectCollection.createWithArray(points))
+        holeInput.setDistanceExtent(depthValue)
 
-        if millTipAngle:
-            holeInput.tipAngle = createDegValue(millTipAngle)        
+        if tipAngleValue is not None:
+            holeInput.tipAngle = tipAngleValue
         holes.add(holeInput)
         return
-    except:
-        global exceptionUICounter
-        if exceptionUICounter < maxExceptions and ui:
-            ui.messageBox('Failed to create hole at point {}:\n{}'.format(getSketchPointCoordinates(sketchPoint),traceback.format_exc()))            
-        exceptionUICounter += 1
+    except RuntimeError: # Fusion API errors, anything else goes to run()
+        details = traceback.format_exc() if len(holeFailures) < maxExceptions else None
+        holeFailures.append(('{} holes starting at point {}'.format(len(points), getSketchPointCoordinates(points[0])), details))
+
+def reportHoleFailures():
+    # One message box for all failed hole features
+    if not holeFailures or not ui:
+        return
+    message = '\n\n'.join('Failed to create {}:\n{}'.format(where, details) for (where, details) in holeFailures[:maxExceptions])
+    if len(holeFailures) > maxExceptions:
+        message += '\n\n...and {} more'.format(len(holeFailures) - maxExceptions)
+    ui.messageBox(message)
 
 def run(context):
-    global holes, bedXdimension, bedYdimension, spoilboardSheetXdimenstion, spoilboardSheetYdimenstion
+    # local copies: turning and two-pass cutting must not change the configuration
+    (bedX, bedY) = (bedXdimension, bedYdimension)
+    (sheetX, sheetY) = (spoilboardSheetXdimenstion, spoilboardSheetYdimenstion)
+    holeFailures.clear()
     # parameter validation and some prep calculations:
     # check parameters
     try:
         
-        holeTipDepth = 0 if (millBitPointAngle==0 or millBitPointAngle==180) else (holeDiameter/math.tan(millBitPointAngle/2 * math.pi/180)/2)
-        throughHoleStockClearance = (throughHoleToolClearance + holeTipDepth) if ensureThroughHoles else 0
-        additionalStock = throughHoleStockClearance + (cncBedClearance if ensureThroughHoles else 0)
-
-        spoilboardSheetThickness = stockThickness + (additionalStock if renderAdditionalStock else 0)
-        holeMaxDepth = stockThickness + (additionalStock if ensureThroughHoles else 0) - cncBedClearance
+        milling = deriveMillingParameters(stockThickness, holeDiameter, millBitPointAngle, throughHoleToolClearance, 
+                                          cncBedClearance, ensureThroughHoles, renderAdditionalStock)
 
         if ensureThroughHoles and ui and showInfoMessages:
-            ui.messageBox("Ensure clearance between stock and cnc bed: {0:.3f} mm".format(additionalStock))
-            #ui.messageBox("holeTipDepth:{0:.3f}\nthroughHoleToolClearance:{1:.3f}\ncncBedClearance:{2:.3f}\nthroughHoleStockClearance:{3:.3f}\nadditionalStock:{4:.3f}\nspoilboardSheetThickness:{5:.3f}\nholeMaxDepth:{6:.3f}".format(holeTipDepth,throughHoleToolClearance,cncBedClearance,throughHoleStockClearance,additionalStock,spoilboardSheetThickness,holeMaxDepth))
+            ui.messageBox("Ensure clearance between stock and cnc bed: {0:.3f} mm".format(milling.additionalStock))
+            #ui.messageBox("holeTipDepth:{0:.3f}\nthroughHoleToolClearance:{1:.3f}\ncncBedClearance:{2:.3f}\nthroughHoleStockClearance:{3:.3f}\nadditionalStock:{4:.3f}\nspoilboardSheetThickness:{5:.3f}\nholeMaxDepth:{6:.3f}".format(milling.holeTipDepth,throughHoleToolClearance,cncBedClearance,milling.throughHoleStockClearance,milling.additionalStock,milling.spoilboardSheetThickness,milling.holeMaxDepth))
 
 
         supportOversizeSpoilboard = False # this checks that Spoilboard sheet is smaller than the board. 
                                         # change this value only if you understand what you are doing
 
         if not supportOversizeSpoilboard:
-            assert bedXdimension >= spoilboardSheetXdimenstion, "spoilboard is too wide for X axis"
-            assert bedYdimension >= spoilboardSheetYdimenstion, "spoilboard is too long for Y axis"
+            assert bedX >= sheetX, "spoilboard is too wide for X axis"
+            assert bedY >= sheetY, "spoilboard is too long for Y axis"
         if validateCountersunkDepth and screwCountersunkDepth>0:
-            assert ensureThroughHoles or (screwCountersunkDepth <= holeMaxDepth), "max hole depth is not deep enough for countrsunk, min holeMaxDepth: " + str(screwCountersunkDepth)
+            assert ensureThroughHoles or (screwCountersunkDepth <= milling.holeMaxDepth), "max hole depth is not deep enough for countrsunk, min holeMaxDepth: " + str(screwCountersunkDepth)
             assert screwCountersunkAngle >= 0 and screwCountersunkAngle <= 180, "screwCountersunkAngle is out of range"        
             if screwCountersunkAngle > 0:
-                requiredCounterSunkDepth = (screwHeadWidth - holeDiameter)/2/ math.tan(screwCountersunkAngle/2 * math.pi/180)/2
+                requiredCounterSunkDepth = requiredCountersinkDepth(screwCountersunkAngle, screwHeadWidth, holeDiameter)
                 assert requiredCounterSunkDepth <= screwCountersunkDepth, "countersunk is too shallow for this angle, min screwCountersunkDepth: " + str(requiredCounterSunkDepth)
 
-        # Completing holes array with symmetrical values
-        if boardXsymmetrical:
-            holes += [[bedXdimension - elem[0], elem[1], elem[2]] for elem in holes]
-
-        if boardYsymmetrical:
-            holes += [[elem[0], bedYdimension - elem[1], elem[2]] for elem in holes]
-
-        # remove dublicates that happen if some points are directly in the middle of the board
-        def remove_duplicate_holes(holes):
-            unique_holes = set()
-            cleaned_holes = []
-            for hole in holes:
-                # Convert the list to a tuple for hashing
-                hole_tuple = tuple(hole)
-                if hole_tuple not in unique_holes:
-                    unique_holes.add(hole_tuple)
-                    cleaned_holes.append(hole)
-            return cleaned_holes
-        holes = remove_duplicate_holes(holes)
-
         # realign all holes to the spoilboard system of coordinates
-        spoilboardXShift = (bedXdimension - spoilboardSheetXdimenstion) / 2 if centerSpoilboard else spoilboardCornerX
-        spoilboardYShift = (bedYdimension - spoilboardSheetYdimenstion) / 2 if centerSpoilboard else spoilboardCornerY
-        baseHoles = [[elem[0] - spoilboardXShift, elem[1] - spoilboardYShift, elem[2]] for elem in holes]
+        spoilboardXShift = (bedX - sheetX) / 2 if centerSpoilboard else spoilboardCornerX
+        spoilboardYShift = (bedY - sheetY) / 2 if centerSpoilboard else spoilboardCornerY
 
-        # remove points that are too close to the edges:
+        # holes that are too close to the edges are not drilled in the spoilboard:
         realKeepout = spoilboardEdgeKeepOut + holeDiameter/2
-        def spoilboardHoleCheck(hole):
-            return hole[0] >= realKeepout and hole[1] >= realKeepout and hole[0] <= spoilboardSheetXdimenstion - realKeepout and hole[1] <= spoilboardSheetYdimenstion - realKeepout    
-        
-        spoilboardHoles = [[elem[0],elem[1],elem[2]] for elem in baseHoles if spoilboardHoleCheck(elem)] 
-
-
-        # getting the coordinates that should be 0,0 - aligning on the first hole
-        centerPoint = spoilboardHoles[0]
-
-        if twoPassMilling: # just cut the board in half, at this point we don't need original dimensions anymore
-            """
-            ok, here is new logic:
-
-            we need to go through all holes, and pull out find shallow marks
-
-            for each hole: if X coordinate <= spoilboardSheetXdimenstion/2 - keep it to drill AND remember max X coordinate
-            Then find 
-
-            """
-            centerPoint = [0, spoilboardSheetYdimenstion, False]
-            for hole in spoilboardHoles:
-                if hole[0] > spoilboardSheetXdimenstion/2: # wrong side of the board, not milling
-                    continue 
-                if hole[0] < centerPoint[0]:  # not the closest to the middle
-                    continue 
-                if hole[1] > centerPoint[1]:  # not the closest to the edge
-                    continue 
-                centerPoint = hole
-
-            secondPassCenterPoint = [spoilboardSheetXdimenstion, 0, False]
-            for hole in spoilboardHoles:
-                if hole[0] <= spoilboardSheetXdimenstion/2: # wrong side - milling, but not centering here
-                    continue
-                if hole[0] > secondPassCenterPoint[0]:  # not the closest to the middle
-                    continue 
-                if hole[1] < secondPassCenterPoint[1]:  # not the closest to the edge
-                    continue 
-                secondPassCenterPoint = hole
-
-            spoilboardHoles = [elem for elem in spoilboardHoles if elem[0]<=spoilboardSheetXdimenstion/2] # remove points that won't be rendered
-            spoilboardSheetXdimenstion = secondPassCenterPoint[0] + realKeepout # cut the board
-        #else:
-
-        if markCornersAsMountingPoints:
-            def findCorner(top, left, holes):
-                cornerY = spoilboardSheetYdimenstion if top else 0
-                cornerX = spoilboardSheetXdimenstion if left else 0
-                magicX = 1 if left else -1
-                magicY = 1 if top else -1
-                corner = [cornerX,cornerY,False]
-
-                for hole in holes:
-                    if hole[1]*magicY > corner[1]*magicY: 
-                        continue 
-                    if hole[0]*magicX > corner[0]*magicX: 
-                        continue 
-                    corner = hole
-                return corner
-            
-            # iterate through spoilboardHoles, find right-most and leftmost
-            findCorner(True,True,spoilboardHoles)[2] = True
-            findCorner(True,False,spoilboardHoles)[2] = True
-            findCorner(False,True,spoilboardHoles)[2] = True
-            findCorner(False,False,spoilboardHoles)[2] = True
-            
+
+        try:
+            layout = prepareHoles(holes, bedX, bedY, sheetX, sheetY, boardXsymmetrical, boardYsymmetrical,
+                                  spoilboardXShift, spoilboardYShift, realKeepout, 
+                                  twoPassMilling, markCornersAsMountingPoints, turnModel)
+        except NoSpoilboardHolesError as error: # nothing to render, stop before the model is cleaned
+            if ui:
+                ui.messageBox(str(error))
+            return
+        (baseHoles, spoilboardHoles, centerPoint, secondPassCenterPoint) = (layout.baseHoles, layout.spoilboardHoles, layout.centerPoint, layout.secondPassCenterPoint)
+        (bedX, bedY, sheetX, sheetY) = (layout.bedX, layout.bedY, layout.sheetX, layout.sheetY)
+        (spoilboardXShift, spoilboardYShift) = (layout.shiftX, layout.shiftY)
 
         if ui and showInfoMessages:
-            ui.messageBox("Mark the zero on spoilboard - X: {} Y: {}".format(centerPoint[0],centerPoint[1]));
-
-        if turnModel:  # to turn model - swap X and Y everywhere
-            (bedXdimension, bedYdimension) = (bedYdimension, bedXdimension)
-            (spoilboardSheetXdimenstion, spoilboardSheetYdimenstion) = (spoilboardSheetYdimenstion, spoilboardSheetXdimenstion)
-            (spoilboardXShift, spoilboardYShift) =  (spoilboardYShift, spoilboardXShift)
-            if twoPassMilling:
-                (secondPassCenterPoint[0],secondPassCenterPoint[1]) = (secondPassCenterPoint[1],secondPassCenterPoint[0])
-            for hole in spoilboardHoles:
-                (hole[0], hole[1]) = (hole[1], hole[0])
-
-            for hole in baseHoles:
-                (hole[0], hole[1]) = (hole[1], hole[0])
-            
+            ui.messageBox("Mark the zero on spoilboard - X: {} Y: {}".format(layout.markPoint.x,layout.markPoint.y));
+
         if cleanModel:
             deleteAllBodiesAndSketches()
 
         xyPlane = rootComp.xYConstructionPlane
-        mountingHoleCollection = createSketchWithPoints("Mounting points", rootComp, spoilboardHoles, xyPlane, True,  -centerPoint[0], -centerPoint[1])
-        holeCollection = createSketchWithPoints("Drilling points", rootComp, spoilboardHoles, xyPlane, False, -centerPoint[0], -centerPoint[1])
+        (holeSketch, mountingHolePoints, holePoints) = createSplitSketchWithPoints("Spoilboard points", rootComp, spoilboardHoles, xyPlane, -centerPoint.x, -centerPoint.y)
 
-        baseHoleCollection = createSketchWithPoints("Flatbed points", rootComp, baseHoles, xyPlane, False, -centerPoint[0], -centerPoint[1]) 
-        baseHoleCollectionCorners = createSketchWithPoints("Flatbed points", rootComp, baseHoles, xyPlane, True, -centerPoint[0], -centerPoint[1]) 
+        # bed holes are all the same, mounting or not
+        (baseHoleSketch, baseHolePoints) = createSketchWithPoints("Flatbed points", rootComp, baseHoles, xyPlane, -centerPoint.x, -centerPoint.y) 
             
         if renderBed:
-            bed = renderBox("CNC bed", bedXdimension, bedYdimension, bedThickness, -centerPoint[0]-spoilboardXShift, -centerPoint[1]-spoilboardYShift, -bedThickness-spoilboardSheetThickness);
-            createHolesFromSketch(bed, baseHoleCollection, bedMetricThread, 2*(bedThickness+spoilboardSheetThickness), 0, 0, 0)
-            createHolesFromSketch(bed, baseHoleCollectionCorners, bedMetricThread, 2*(bedThickness+spoilboardSheetThickness), 0, 0, 0)
+            bed = renderBox("CNC bed", bedX, bedY, bedThickness, -centerPoint.x-spoilboardXShift, -centerPoint.y-spoilboardYShift, -bedThickness-milling.spoilboardSheetThickness);
+            createHolesFromSketch(bed, baseHolePoints, holeInputFactory(bedMetricThread), 2*(bedThickness+milling.spoilboardSheetThickness))
 
         if renderSpoilboard:
-            spoilboard = renderBox("Spoilboard", spoilboardSheetXdimenstion, spoilboardSheetYdimenstion, spoilboardSheetThickness, -centerPoint[0], -centerPoint[1], -spoilboardSheetThickness);
-            createHolesFromSketch(spoilboard, mountingHoleCollection, holeDiameter, holeMaxDepth-holeTipDepth, screwHeadWidth, screwCountersunkAngle, millBitPointAngle)
-            createHolesFromSketch(spoilboard, holeCollection, holeDiameter, holeMaxDepth-holeTipDepth, holeDiameter + 2*chamferWidth, chamferHolesAngle, millBitPointAngle)
+            spoilboard = renderBox("Spoilboard", sheetX, sheetY, milling.spoilboardSheetThickness, -centerPoint.x, -centerPoint.y, -milling.spoilboardSheetThickness);
+            mountingHoleInput = holeInputFactory(holeDiameter, screwHeadWidth, screwCountersunkAngle, screwCountersunkDepth)
+            drillingHoleInput = holeInputFactory(holeDiameter, holeDiameter + 2*chamferWidth, chamferHolesAngle, screwCountersunkDepth)
+            createHolesFromSketch(spoilboard, mountingHolePoints, mountingHoleInput, milling.holeMaxDepth-milling.holeTipDepth, millBitPointAngle)
+            createHolesFromSketch(spoilboard, holePoints, drillingHoleInput, milling.holeMaxDepth-milling.holeTipDepth, millBitPointAngle)
         
         if renderSpoilboard and twoPassMilling:
-            marksCollection = createSketchWithPoints("Second pass zero point {},{},{}".format(secondPassCenterPoint[0],secondPassCenterPoint[1],secondPassCenterPoint[2]), rootComp, [secondPassCenterPoint,centerPoint], xyPlane, secondPassCenterPoint[2], -centerPoint[0], -centerPoint[1])
-            createHolesFromSketch(spoilboard, marksCollection, zeroMarkWidth, zeroMarkDepth, 0, 0, millBitPointAngle)
+            # both zero points are marked when they are the same kind of hole, otherwise only the second pass one
+            markPoints = [point for point in (secondPassCenterPoint, centerPoint) if point.mounting == secondPassCenterPoint.mounting]
+            (marksSketch, marksPoints) = createSketchWithPoints("Second pass zero point {},{},{}".format(secondPassCenterPoint.x,secondPassCenterPoint.y,secondPassCenterPoint.mounting), rootComp, markPoints, xyPlane, -centerPoint.x, -centerPoint.y)
+            createHolesFromSketch(spoilboard, marksPoints, holeInputFactory(zeroMarkWidth), zeroMarkDepth, millBitPointAngle)
+
+        reportHoleFailures()
 
     except:
         if ui:
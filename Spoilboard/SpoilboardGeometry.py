@@ -0,0 +1,223 @@
+"""
+For this file only:
+
+MIT License
+
+Copyright (c) 2023  Evgeny Balashov https://www.linkedin.com/in/balashovevgeny/
+Original source and latest versions: https://github.com/heavior/parametric-spoilboard
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Geometry for the parametric spoilboard: hole pattern symmetry, spoilboard coordinates, keepout and milling depths.
+
+Nothing here depends on Autodesk Fusion, so the hole layout can be checked and timed with a regular Python interpreter.
+Spoilboard.py imports these functions and only deals with the Fusion API.
+"""
+
+import functools
+import math
+from collections import namedtuple
+from dataclasses import dataclass
+
+Hole = namedtuple('Hole', 'x y mounting') # hole center and whether it's used to mount the spoilboard
+
+
+# Both depths depend only on the configuration, so they are calculated once per set of values
+@functools.lru_cache(maxsize=None)
+def millTipDepth(pointAngle, diameter):
+    # height of the cone left by a pointed bit: radius / tan(half of the included angle)
+    if pointAngle == 0 or pointAngle == 180: # flat end mill
+        return 0
+    return diameter/2 / math.tan(math.radians(pointAngle/2))
+
+@functools.lru_cache(maxsize=None)
+def requiredCountersinkDepth(countersinkAngle, headWidth, diameter):
+    # minimal countersink depth accepted by validation: half of the cone height between head and hole radius
+    return (headWidth - diameter)/2 / math.tan(math.radians(countersinkAngle/2))/2
+
+
+@dataclass(frozen=True)
+class MillingParameters:
+    holeTipDepth: float                 # cone left by the mill bit under the hole
+    throughHoleStockClearance: float    # how much deeper than the stock the hole goes to come out clean
+    additionalStock: float              # clearance between the stock and the cnc bed required for through holes
+    spoilboardSheetThickness: float     # rendered spoilboard thickness
+    holeMaxDepth: float                 # deepest the mill can go, keeping away from the cnc bed
+
+# Derived values only depend on the configuration, repeated runs with the same parameters reuse them
+@functools.lru_cache(maxsize=None)
+def deriveMillingParameters(stockThickness, holeDiameter, millBitPointAngle, throughHoleToolClearance,
+                            cncBedClearance, ensureThroughHoles, renderAdditionalStock):
+    holeTipDepth = millTipDepth(millBitPointAngle, holeDiameter)
+    throughHoleStockClearance = (throughHoleToolClearance + holeTipDepth) if ensureThroughHoles else 0
+    additionalStock = throughHoleStockClearance + (cncBedClearance if ensureThroughHoles else 0)
+
+    return MillingParameters(
+        holeTipDepth = holeTipDepth,
+        throughHoleStockClearance = throughHoleStockClearance,
+        additionalStock = additionalStock,
+        spoilboardSheetThickness = stockThickness + (additionalStock if renderAdditionalStock else 0),
+        holeMaxDepth = stockThickness + (additionalStock if ensureThroughHoles else 0) - cncBedClearance,
+    )
+
+
+def computeHoles(holes, bedX, bedY, symmetricalX, symmetricalY, shiftX, shiftY, sheetX, sheetY, keepout):
+    """
+    Completes the hole pattern with symmetrical values and moves it to the spoilboard system of coordinates.
+    Returns (baseHoles, spoilboardHoles): all holes of the bed, and only holes that are at least keepout away
+    from the spoilboard sheet edges.
+    """
+    spoilboardMinX = keepout
+    spoilboardMinY = keepout
+    spoilboardMaxX = sheetX - keepout
+    spoilboardMaxY = sheetY - keepout
+
+    # Mirroring (original holes first), removing dublicates, shifting and keepout in one pass
+    # (dublicates happen if some points are directly in the middle of the board, compared rounded)
+    mirrorX = ((0, 1), (bedX, -1)) if symmetricalX else ((0, 1),)
+    mirrorY = ((0, 1), (bedY, -1)) if symmetricalY else ((0, 1),)
+    uniqueHoles = {}
+    baseHoles = []
+    spoilboardHoles = []
+    for (offsetY, signY) in mirrorY:
+        for (offsetX, signX) in mirrorX:
+            for x, y, mounting in holes:
+                x = offsetX + signX*x
+                y = offsetY + signY*y
+                key = (round(x, 4), round(y, 4))
+                if key in uniqueHoles:
+                    if mounting: # mounting hole wins over a regular one in the same spot
+                        (baseIndex, spoilboardIndex) = uniqueHoles[key]
+                        baseHoles[baseIndex] = baseHoles[baseIndex]._replace(mounting=True)
+                        if spoilboardIndex is not None:
+                            spoilboardHoles[spoilboardIndex] = baseHoles[baseIndex]
+                    continue
+                hole = Hole(x - shiftX, y - shiftY, mounting)
+                spoilboardIndex = None
+                if spoilboardMinX <= hole.x <= spoilboardMaxX and spoilboardMinY <= hole.y <= spoilboardMaxY:
+                    spoilboardIndex = len(spoilboardHoles)
+                    spoilboardHoles.append(hole)
+                uniqueHoles[key] = (len(baseHoles), spoilboardIndex)
+                baseHoles.append(hole)
+
+    return (baseHoles, spoilboardHoles)
+
+
+class NoSpoilboardHolesError(ValueError):
+    # raised when keepout and sheet position leave no holes to drill, a configuration problem rather than a bug
+    pass
+
+
+def turnHoles(holes):
+    # Turns holes 90 degrees by swapping X and Y, returns a new list
+    return [Hole(y, x, mounting) for (x, y, mounting) in holes]
+
+HoleLayout = namedtuple('HoleLayout', [
+    'baseHoles',                # all bed holes
+    'spoilboardHoles',          # holes drilled in this spoilboard (pass)
+    'centerPoint',              # hole used as 0,0
+    'secondPassCenterPoint',    # zero mark for the second pass, None without two pass milling
+    'markPoint',                # centerPoint before turning - where the operator marks zero on the board
+    'bedX', 'bedY', 'sheetX', 'sheetY', 'shiftX', 'shiftY', # dimensions and spoilboard position, turned if needed
+])
+
+
+def prepareHoles(holes, bedX, bedY, sheetX, sheetY, symmetricalX, symmetricalY, shiftX, shiftY, keepout,
+                 twoPass, markCorners, turn):
+    """
+    Whole hole preparation before anything is sent to Fusion: symmetry, spoilboard coordinates and keepout,
+    zero points, two pass split, corner mounting holes and turning the model.
+    Returns HoleLayout.
+    """
+    (baseHoles, spoilboardHoles) = computeHoles(holes, bedX, bedY, symmetricalX, symmetricalY, shiftX, shiftY, sheetX, sheetY, keepout)
+
+    if not spoilboardHoles:
+        raise NoSpoilboardHolesError("No holes fit on the spoilboard, check sheet dimensions, position and spoilboardEdgeKeepOut")
+
+    # getting the coordinates that should be 0,0 - aligning on the first hole
+    centerPoint = spoilboardHoles[0]
+    secondPassCenterPoint = None
+
+    if twoPass: # just cut the board in half, at this point we don't need original dimensions anymore
+        """
+        ok, here is new logic:
+
+        we need to go through all holes, and pull out find shallow marks
+
+        for each hole: if X coordinate <= sheetX/2 - keep it to drill AND remember max X coordinate
+        Then find 
+
+        """
+        # one pass through the holes: split them by the middle of the board and pick both zero points
+        centerPoint = Hole(0, sheetY, False)
+        secondPassCenterPoint = Hole(sheetX, 0, False)
+        firstPassHoles = []
+        for hole in spoilboardHoles:
+            if hole.x <= sheetX/2: # milling side of the board
+                firstPassHoles.append(hole)
+                if hole.x < centerPoint.x:  # not the closest to the middle
+                    continue 
+                if hole.y > centerPoint.y:  # not the closest to the edge
+                    continue 
+                centerPoint = hole
+            else: # wrong side - not milling, but centering the second pass here
+                if hole.x > secondPassCenterPoint.x:  # not the closest to the middle
+                    continue 
+                if hole.y < secondPassCenterPoint.y:  # not the closest to the edge
+                    continue 
+                secondPassCenterPoint = hole
+
+        spoilboardHoles = firstPassHoles # remove points that won't be rendered
+        sheetX = secondPassCenterPoint.x + keepout # cut the board
+
+    if markCorners:
+        # find all four corners in one pass through spoilboardHoles
+        # every corner starts from the opposite edge of the sheet and moves to any hole that is not further away on both axes
+        cornerDirections = [(1, 1), (-1, 1), (1, -1), (-1, -1)] # (magicX, magicY)
+        cornerHoles = [Hole(sheetX if magicX > 0 else 0, sheetY if magicY > 0 else 0, False) for (magicX, magicY) in cornerDirections]
+        for hole in spoilboardHoles:
+            for index, (magicX, magicY) in enumerate(cornerDirections):
+                corner = cornerHoles[index]
+                if hole.y*magicY > corner.y*magicY: 
+                    continue 
+                if hole.x*magicX > corner.x*magicX: 
+                    continue 
+                cornerHoles[index] = hole
+
+        corners = {(corner.x, corner.y) for corner in cornerHoles}
+        spoilboardHoles = [hole._replace(mounting=True) if (hole.x, hole.y) in corners else hole for hole in spoilboardHoles]
+        if (centerPoint.x, centerPoint.y) in corners: # center point is one of the holes, keep its flag in sync
+            centerPoint = centerPoint._replace(mounting=True)
+
+    markPoint = centerPoint
+
+    if turn:  # to turn model - swap X and Y everywhere
+        (bedX, bedY) = (bedY, bedX)
+        (sheetX, sheetY) = (sheetY, sheetX)
+        (shiftX, shiftY) = (shiftY, shiftX)
+        if twoPass:
+            (secondPassCenterPoint,) = turnHoles([secondPassCenterPoint])
+        (centerPoint,) = turnHoles([centerPoint])
+        spoilboardHoles = turnHoles(spoilboardHoles)
+        baseHoles = turnHoles(baseHoles)
+
+    return HoleLayout(baseHoles, spoilboardHoles, centerPoint, secondPassCenterPoint, markPoint,
+                      bedX, bedY, sheetX, sheetY, shiftX, shiftY)
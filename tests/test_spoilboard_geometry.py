@@ -0,0 +1,133 @@
+"""
+Checks the Fusion-free hole geometry against the shipped configuration of Spoilboard.py.
+
+SpoilboardGeometry.py lives in the Fusion script folder, which is not a regular package, so it is imported from there directly.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Spoilboard'))
+
+from SpoilboardGeometry import Hole, NoSpoilboardHolesError, computeHoles, prepareHoles
+
+# Shipped configuration from Spoilboard.py (publishToCommunity settings)
+bedX = 360
+bedY = 300
+sheetX = 152
+sheetY = 254
+shiftX = (bedX - sheetX)/2  # centerSpoilboard
+shiftY = (bedY - sheetY)/2
+keepout = 5 + 8/2           # spoilboardEdgeKeepOut + holeDiameter/2
+
+holes = [
+    Hole(20, 20, True),
+    Hole(80, 20, False),
+    Hole(140, 20, False),
+    Hole(50, 45, False),
+    Hole(110, 45, False),
+    Hole(20, 70, False),
+    Hole(80, 70, False),
+    Hole(140, 70, False),
+    Hole(110, 97.5, False),
+    Hole(70, 108, False),
+    Hole(20, 125, False),
+    Hole(140, 125, False),
+    Hole(70, bedY/2, False),
+    Hole(110, bedY/2, False),
+]
+
+spoilboardHoles = [
+    Hole(36, 47, False), Hole(36, 102, False), Hole(116, 47, False), Hole(116, 102, False),
+    Hole(36, 207, False), Hole(36, 152, False), Hole(116, 207, False), Hole(116, 152, False),
+]
+
+
+def layout(twoPass=False, markCorners=False, turn=False):
+    return prepareHoles(holes, bedX, bedY, sheetX, sheetY, True, True, shiftX, shiftY, keepout,
+                        twoPass, markCorners, turn)
+
+
+def testComputeHolesShippedConfig():
+    (baseHoles, spoilboard) = computeHoles(holes, bedX, bedY, True, True, shiftX, shiftY, sheetX, sheetY, keepout)
+
+    # 12 holes mirrored 4 times, the 2 holes in the middle of Y are only mirrored by X
+    assert len(baseHoles) == 52
+    assert len({(hole.x, hole.y) for hole in baseHoles}) == 52
+    middleRow = [hole for hole in baseHoles if hole.y == bedY/2 - shiftY]
+    assert sorted(hole.x + shiftX for hole in middleRow) == [70, 110, 250, 290]
+
+    # base holes are in the spoilboard system of coordinates, original holes come first
+    assert baseHoles[0] == Hole(20 - shiftX, 20 - shiftY, True)
+    assert spoilboard == spoilboardHoles
+
+
+def testMountingDuplicateWins():
+    (baseHoles, spoilboard) = computeHoles([Hole(30, 150, False), Hole(30, 150, True)], 300, 300, False, True,
+                                           0, 0, 300, 300, 0)
+    assert baseHoles == [Hole(30, 150, True)]
+    assert spoilboard == [Hole(30, 150, True)]
+
+    # mirrored duplicate: the mounting copy comes second and still wins
+    (baseHoles, spoilboard) = computeHoles([Hole(30, 150.00001, False), Hole(30, 149.99999, True)], 300, 300, False, True,
+                                           0, 0, 300, 300, 0)
+    assert len(baseHoles) == 1 and baseHoles[0].mounting
+    assert spoilboard == baseHoles
+
+
+def testTwoPass():
+    result = layout(twoPass=True)
+
+    assert result.spoilboardHoles == [Hole(36, 47, False), Hole(36, 102, False), Hole(36, 207, False), Hole(36, 152, False)]
+    assert result.centerPoint == Hole(36, 47, False)
+    assert result.secondPassCenterPoint == Hole(116, 207, False)
+    assert result.sheetX == 116 + keepout
+    assert result.sheetY == sheetY
+
+
+def testMarkCorners():
+    result = layout(markCorners=True)
+
+    mounting = [hole for hole in result.spoilboardHoles if hole.mounting]
+    assert mounting == [Hole(36, 47, True), Hole(116, 47, True), Hole(36, 207, True), Hole(116, 207, True)]
+    assert len(result.spoilboardHoles) == len(spoilboardHoles)
+    # center point is the first spoilboard hole and a corner, its flag follows the list
+    assert result.centerPoint == result.spoilboardHoles[0] == Hole(36, 47, True)
+
+
+def testTwoPassMarkCorners():
+    result = layout(twoPass=True, markCorners=True)
+
+    assert [hole for hole in result.spoilboardHoles if hole.mounting] == [Hole(36, 47, True), Hole(36, 207, True)]
+    assert result.centerPoint == Hole(36, 47, True)
+
+
+def testTurn():
+    plain = layout(markCorners=True)
+    turned = layout(markCorners=True, turn=True)
+
+    assert turned.spoilboardHoles == [Hole(hole.y, hole.x, hole.mounting) for hole in plain.spoilboardHoles]
+    assert turned.baseHoles == [Hole(hole.y, hole.x, hole.mounting) for hole in plain.baseHoles]
+    assert (turned.bedX, turned.bedY) == (bedY, bedX)
+    assert (turned.sheetX, turned.sheetY) == (sheetY, sheetX)
+    assert (turned.shiftX, turned.shiftY) == (shiftY, shiftX)
+    assert turned.centerPoint == Hole(47, 36, True)
+    # operator marks zero on the board before it is turned
+    assert turned.markPoint == plain.centerPoint == Hole(36, 47, True)
+
+
+def testTwoPassTurn():
+    turned = layout(twoPass=True, turn=True)
+
+    assert turned.centerPoint == Hole(47, 36, False)
+    assert turned.secondPassCenterPoint == Hole(207, 116, False)
+    assert turned.markPoint == Hole(36, 47, False)
+    assert (turned.sheetX, turned.sheetY) == (sheetY, 116 + keepout)
+
+
+def testNoSpoilboardHoles():
+    with pytest.raises(NoSpoilboardHolesError):
+        prepareHoles(holes, bedX, bedY, sheetX, sheetY, True, True, shiftX, shiftY, sheetX,
+                     False, False, False)